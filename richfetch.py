@@ -1,37 +1,207 @@
 #!/usr/bin/env python
 
 import os
-import psutil
+import sys
+import math
+import time
+import bisect
 import socket
+import threading
 import typing
-import argparse
 import platform
-import requests
-import psutil._common
-from termcolor import colored
-from cpuinfo import get_cpu_info
-from datetime import datetime, timedelta
+import functools
+
+# psutil is only needed for the fallbacks on systems without /proc and /sys, so it
+# is imported lazily in those code paths to keep it out of the common startup path.
+
+
+USAGE: str = """usage: richfetch [-h] [--show-public-ip] [--show-private-ip]
+                 [--watch [SECONDS]]
+
+RichFetch - A customizable system information tool
+
+options:
+  -h, --help         show this help message and exit
+  --show-public-ip   Show public IP address
+  --show-private-ip  Show private IP address
+  --watch [SECONDS]  Redraw every SECONDS seconds (default: 2) until interrupted
+"""
+_FLAGS: frozenset[str] = frozenset(
+    ("-h", "--help", "--show-public-ip", "--show-private-ip", "--watch")
+)
+
+CACHE_DIR: str = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "richfetch"
+)
+PUBLIC_IP_CACHE: str = os.path.join(CACHE_DIR, "public_ip")
+PUBLIC_IP_CACHE_TTL: int = 3600
+
+# ANSI escape sequences for the colors used by richfetch. Whether to emit them is
+# decided once at import, following the same rules as termcolor: ANSI_COLORS_DISABLED
+# and NO_COLOR disable color, then FORCE_COLOR enables it, and otherwise a dumb
+# terminal or a non-tty stdout disable it.
+_ANSI_COLORS: dict[str, str] = {
+    "red": "\x1b[31m",
+    "green": "\x1b[32m",
+    "yellow": "\x1b[33m",
+    "blue": "\x1b[34m",
+    "magenta": "\x1b[35m",
+    "cyan": "\x1b[36m",
+    "white": "\x1b[97m",
+}
+_ANSI_RESET: str = "\x1b[0m"
+_USE_COLOR: bool = (
+    "ANSI_COLORS_DISABLED" not in os.environ
+    and "NO_COLOR" not in os.environ
+    and (
+        "FORCE_COLOR" in os.environ
+        or (os.environ.get("TERM") != "dumb" and sys.stdout.isatty())
+    )
+)
 
 
-def get_public_ip() -> str | None:
+def colored(text: str, color: str) -> str:
+    """
+    Wraps text in the ANSI escape sequence for the given color.
+
+    This is a minimal replacement for `termcolor.colored` that uses the precomputed
+    sequences in `_ANSI_COLORS`. If color output is disabled, the text is returned
+    unchanged.
+
+    Args:
+        text (str): The text to color.
+        color (str): The name of the color (e.g. "red" or "green").
+
+    Returns:
+        str: The text wrapped in ANSI color codes, or the text itself if color output
+             is disabled.
+    """
+    if not _USE_COLOR:
+        return text
+    return f"{_ANSI_COLORS[color]}{text}{_ANSI_RESET}"
+
+
+def get_username() -> str:
+    """
+    Retrieves the name of the user running the program.
+
+    On POSIX systems the name is looked up from the real user ID with
+    `pwd.getpwuid`. Unlike `os.getlogin()`, this does not scan utmp or need a
+    controlling terminal, so it also works under sudo, ssh, cron and containers.
+    If the user ID has no passwd entry, `$USER` or the numeric ID is used. On
+    Windows, it falls back to `os.getlogin()`.
+
+    Returns:
+        str: The username.
+    """
+    try:
+        import pwd
+    except ImportError:
+        return os.getlogin()
+
+    uid: int = os.getuid()
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return os.environ.get("USER") or str(uid)
+
+
+# Invariant for the lifetime of the process, so looked up once at import
+_USERNAME: str = get_username()
+_HOSTNAME: str = socket.gethostname()
+
+
+def load_cached_ip(path: str, ttl: float) -> str | None:
+    """
+    Reads a cached IP address from disk if the cache file is still fresh.
+
+    The cache is considered fresh when the file was modified less than `ttl` seconds
+    ago. A missing, unreadable, stale or empty cache file is treated as a miss.
+
+    Args:
+        path (str): The path of the cache file.
+        ttl (float): The maximum age of the cache file in seconds.
+
+    Returns:
+        str | None: The cached IP address, or None on a cache miss.
+    """
+    try:
+        if time.time() - os.stat(path).st_mtime >= ttl:
+            return None
+        with open(path) as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def store_cached_ip(path: str, ip: str) -> None:
+    """
+    Writes an IP address to the cache file on disk.
+
+    The address is written to a temporary file which then atomically replaces the
+    cache file via `os.replace`, so a concurrent reader never sees a partial write.
+    Errors are ignored, since the cache is only an optimization.
+
+    Args:
+        path (str): The path of the cache file.
+        ip (str): The IP address to cache.
+    """
+    tmp_path: str = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w") as f:
+            f.write(ip)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def fetch_public_ip() -> str | None:
     """
-    Retrieves the public IP address of the current machine using the ipify API.
+    Fetches the public IP address of the current machine using the ipify API.
 
     This function sends a request to the ipify service to obtain the public IP address.
+    The plain-text endpoint is used, so the response body is the address itself and
+    needs no JSON parsing. At most 64 bytes are read, and the body is rejected unless
+    it is a valid IP address. The request is bounded by a 2 second timeout so a flaky
+    network cannot hang the whole program.
+
+    Public IP addresses rarely change, so a successful result is cached on disk in
+    `PUBLIC_IP_CACHE` and reused for `PUBLIC_IP_CACHE_TTL` seconds without touching
+    the network.
+
     If the request is successful, it returns the IP address as a string. If an error
-    occurs during the request (e.g., network issues or server errors), it logs the error
-    and returns None.
+    occurs during the request (e.g., network issues, timeouts or server errors), it logs
+    the error and returns None.
 
     Returns:
         str | None: The public IP address as a string if the request is successful,
                     or None if an error occurs.
     """
+    cached_ip: str | None = load_cached_ip(PUBLIC_IP_CACHE, PUBLIC_IP_CACHE_TTL)
+    if cached_ip:
+        return cached_ip
+
+    # Imported here so the HTTP/TLS stack is only loaded when the public IP is wanted
+    import ipaddress
+    import urllib.request
+
     try:
-        response: requests.Response = requests.get("https://api.ipify.org?format=json")
-        response.raise_for_status()
-        return response.json()["ip"]
-    except requests.exceptions.RequestException as e:
-        # Handle specific request exceptions (e.g., network errors)
+        with urllib.request.urlopen("https://api.ipify.org", timeout=2) as response:
+            ip: str = response.read(64).decode().strip()
+        # Reject anything that is not an address (e.g. a captive portal page), so it
+        # is neither displayed nor cached
+        ipaddress.ip_address(ip)
+        store_cached_ip(PUBLIC_IP_CACHE, ip)
+        return ip
+    except ValueError:
+        print("Error retrieving public IP address: unexpected response from ipify")
+        return None
+    except OSError as e:
+        # Handle network errors (urllib.error.URLError, timeouts, etc.)
         print(f"Error retrieving public IP address: {e}")
         return None
     except Exception as e:
@@ -40,11 +210,95 @@ def get_public_ip() -> str | None:
         return None
 
 
+# In-process copy of the public IP, so repeated lookups (e.g. --watch frames) do not
+# go back to the network. A failed lookup is retried after PUBLIC_IP_RETRY_DELAY
+# seconds, doubling after each further failure up to PUBLIC_IP_CACHE_TTL.
+PUBLIC_IP_RETRY_DELAY: float = 30.0
+_public_ip: str | None = None
+_public_ip_expires: float = 0.0
+_public_ip_retry_delay: float = PUBLIC_IP_RETRY_DELAY
+_public_ip_lock: threading.Lock = threading.Lock()
+
+
+def get_public_ip() -> str | None:
+    """
+    Retrieves the public IP address of the current machine.
+
+    The address is fetched with `fetch_public_ip` on first use and kept in memory for
+    `PUBLIC_IP_CACHE_TTL` seconds, since it can change while the program runs (e.g.
+    after a DHCP renewal or when a VPN connects). A failed lookup is retried with an
+    increasing delay, so an offline machine does not wait on the network every time.
+    A lock ensures that concurrent callers (e.g. threads in the probe pool) share a
+    single lookup instead of racing to the network.
+
+    Returns:
+        str | None: The public IP address as a string, or None if it could not be
+                    retrieved.
+    """
+    global _public_ip, _public_ip_expires, _public_ip_retry_delay
+
+    with _public_ip_lock:
+        now: float = time.monotonic()
+        if now >= _public_ip_expires:
+            _public_ip = fetch_public_ip()
+            if _public_ip is not None:
+                _public_ip_expires = now + PUBLIC_IP_CACHE_TTL
+                _public_ip_retry_delay = PUBLIC_IP_RETRY_DELAY
+            else:
+                _public_ip_expires = now + _public_ip_retry_delay
+                _public_ip_retry_delay = min(
+                    _public_ip_retry_delay * 2, PUBLIC_IP_CACHE_TTL
+                )
+        return _public_ip
+
+
+# ioctl request number for reading an interface's IPv4 address on Linux
+SIOCGIFADDR: int = 0x8915
+
+
+def get_default_interface() -> str | None:
+    """
+    Finds the network interface that carries the default route on Linux.
+
+    This function reads the IPv4 routing table from `/proc/net/route` and returns the
+    interface of the usable default route (destination 0.0.0.0) with the lowest
+    metric.
+
+    Returns:
+        str | None: The name of the interface (e.g. "eth0"), or None if there is no
+                    default route or `/proc/net/route` is unavailable.
+    """
+    interface: str | None = None
+    best_metric: int | None = None
+
+    try:
+        with open("/proc/net/route") as f:
+            next(f, None)  # Skip the header line
+            for line in f:
+                fields: list[str] = line.split()
+                if len(fields) < 7 or fields[1] != "00000000":
+                    continue
+                if not int(fields[3], 16) & 0x1:  # RTF_UP
+                    continue
+                metric: int = int(fields[6])
+                if best_metric is None or metric < best_metric:
+                    interface, best_metric = fields[0], metric
+    except (OSError, ValueError):
+        return None
+
+    return interface
+
+
 def get_private_ip() -> str | None:
     """
     Retrieves the private IP address of the current machine.
 
-    This function creates a temporary UDP socket to determine the local IP address
+    On Linux this function looks up the interface of the default route with
+    `get_default_interface` and asks the kernel for its address with the
+    `SIOCGIFADDR` ioctl. This needs no routing decision towards a remote host, so
+    it is fast and does not depend on reaching the outside network.
+
+    Otherwise, it creates a temporary UDP socket to determine the local IP address
     by connecting to a well-known public IP (Google's DNS server, 8.8.8.8). It does not
     send any data to the server; the operation is used only to get the local IP address
     assigned to the network interface.
@@ -56,6 +310,23 @@ def get_private_ip() -> str | None:
         str | None: The private IP address as a string if the operation is successful,
                     or None if an error occurs.
     """
+    interface: str | None = get_default_interface()
+    if interface is not None:
+        try:
+            # Imported here since fcntl is not available on Windows
+            import fcntl
+            import struct
+
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+                ifreq: bytes = fcntl.ioctl(
+                    sock.fileno(),
+                    SIOCGIFADDR,
+                    struct.pack("256s", interface[:15].encode()),
+                )
+            return socket.inet_ntoa(ifreq[20:24])
+        except (ImportError, OSError):
+            pass
+
     try:
         s: socket.socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.connect(("8.8.8.8", 80))
@@ -72,38 +343,251 @@ def get_private_ip() -> str | None:
         return None
 
 
+def read_proc_file(path: str, size: int = 8192) -> bytes | None:
+    """
+    Reads a `/proc` or `/sys` pseudo-file with a single `read()` call.
+
+    The file is opened unbuffered and up to `size` bytes are read at once. This is
+    one open/read/close per file, and the callers parse the returned buffer in
+    memory.
+
+    Args:
+        path (str): The path of the file to read.
+        size (int): The maximum number of bytes to read.
+
+    Returns:
+        bytes | None: The contents of the file, or None if it cannot be read.
+    """
+    try:
+        with open(path, "rb", buffering=0) as f:
+            return f.read(size)
+    except OSError:
+        return None
+
+
+@functools.lru_cache(maxsize=1)
+def get_cpu_brand() -> str:
+    """
+    Retrieves the brand string of the CPU (e.g. "AMD Ryzen 7 5800X 8-Core Processor").
+
+    On Linux the brand is read directly from the first "model name" line of
+    `/proc/cpuinfo`, which sits near the top of the file, so a single 8 KiB read is
+    enough. On macOS it is queried once through `sysctl -n machdep.cpu.brand_string`.
+    If neither source is available, it falls back to `platform.processor()`.
+
+    The CPU model cannot change while the machine is running, so the result is
+    cached for the lifetime of the process.
+
+    Returns:
+        str: The CPU brand string, or "Unknown CPU" if it cannot be determined.
+    """
+    cpuinfo: bytes = read_proc_file("/proc/cpuinfo") or b""
+    for line in cpuinfo.split(b"\n"):
+        if line.startswith(b"model name"):
+            return line.split(b":", 1)[1].strip().decode()
+
+    if platform.system() == "Darwin":
+        import subprocess
+
+        try:
+            brand: str = subprocess.run(
+                ["sysctl", "-n", "machdep.cpu.brand_string"],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout.strip()
+            if brand:
+                return brand
+        except (OSError, subprocess.SubprocessError):
+            pass
+
+    return platform.processor() or "Unknown CPU"
+
+
+def read_cpu_times() -> tuple[int, int] | None:
+    """
+    Reads the aggregate CPU time counters from `/proc/stat`.
+
+    Only the first line of `/proc/stat`, which sums all CPUs, is read. The busy and
+    idle jiffies are taken from the user, nice, system, idle, iowait, irq, softirq and
+    steal columns, the same ones `psutil` uses.
+
+    Returns:
+        tuple[int, int] | None: The total and idle (idle + iowait) jiffies, or None if
+                                `/proc/stat` is unavailable.
+    """
+    stat: bytes | None = read_proc_file("/proc/stat")
+    if not stat:
+        return None
+
+    fields: list[bytes] = stat.split(b"\n", 1)[0].split()
+    try:
+        times: list[int] = [int(field) for field in fields[1:9]]
+    except ValueError:
+        return None
+
+    return sum(times), times[3] + times[4]
+
+
+# CPU usage is the delta between two samples. The first one is taken on the first
+# call to get_cpu_usage() (only --watch asks for it), and each reading becomes the
+# baseline for the next one. Without /proc/stat, psutil.cpu_percent() keeps the
+# baseline instead.
+CPU_SAMPLE_WINDOW: float = 0.1
+_cpu_sample_started: float | None = None
+_cpu_times_sample: tuple[int, int] | None = None
+
+
+def get_cpu_usage() -> float | None:
+    """
+    Retrieves the CPU usage percentage since the previous reading.
+
+    This function compares the current `/proc/stat` counters with the previous
+    sample and then keeps the new counters as the baseline for the next call. On
+    systems without `/proc/stat`, it falls back to `psutil.cpu_percent()`.
+
+    A delta over a few milliseconds is mostly noise (and mostly richfetch's own
+    work), so the function waits until at least `CPU_SAMPLE_WINDOW` seconds have
+    passed since the previous sample. On the first call it takes the initial
+    sample and waits the whole window, which is why only `--watch` shows CPU usage;
+    a single run would otherwise spend most of its time in this wait.
+
+    Returns:
+        float | None: The CPU usage percentage, rounded to one decimal place, or None
+                      if no meaningful reading is available.
+    """
+    global _cpu_sample_started, _cpu_times_sample
+
+    if _cpu_sample_started is None:
+        _cpu_times_sample = read_cpu_times()
+        if _cpu_times_sample is None:
+            import psutil
+
+            psutil.cpu_percent(interval=None)
+        _cpu_sample_started = time.monotonic()
+
+    remaining: float = CPU_SAMPLE_WINDOW - (time.monotonic() - _cpu_sample_started)
+    if remaining > 0:
+        time.sleep(remaining)
+    _cpu_sample_started = time.monotonic()
+
+    if _cpu_times_sample is None:
+        import psutil
+
+        return psutil.cpu_percent(interval=None)
+
+    previous: tuple[int, int] = _cpu_times_sample
+    cpu_times: tuple[int, int] | None = read_cpu_times()
+    if cpu_times is None:
+        return None
+    _cpu_times_sample = cpu_times
+
+    total_delta: int = cpu_times[0] - previous[0]
+    idle_delta: int = cpu_times[1] - previous[1]
+    if total_delta <= 0:
+        return None
+
+    return round(100 * (1 - idle_delta / total_delta), 1)
+
+
+CPU_SENSORS: list[str] = [
+    "coretemp",
+    "k10temp",
+    "cpu_thermal",
+    "cpu-thermal",
+    "lm_sensors",
+    "asus-nb",
+    "lm75",
+    "acpitz",
+]
+# Sensor names as they appear in the hwmon `name` files, mapped to their priority
+_CPU_SENSOR_RANKS: dict[bytes, int] = {
+    sensor.encode(): rank for rank, sensor in enumerate(CPU_SENSORS)
+}
+
+
+@functools.lru_cache(maxsize=1)
+def get_cpu_temperature_path() -> str | None:
+    """
+    Locates the sysfs file holding the CPU temperature on Linux.
+
+    This function reads the `name` of the devices under `/sys/class/hwmon` and picks
+    the one that appears first in `CPU_SENSORS`, stopping early once the top-ranked
+    sensor is found. Its `temp1_input` file holds the current CPU temperature. The
+    hwmon devices do not change after boot, so the discovered path is cached.
+
+    Returns:
+        str | None: The path of the temperature input file, or None if no known
+                    sensor is found or `/sys/class/hwmon` is unavailable.
+    """
+    best_rank: int = len(CPU_SENSORS)
+    best_path: str | None = None
+
+    try:
+        with os.scandir("/sys/class/hwmon") as entries:
+            for entry in entries:
+                try:
+                    with open(f"{entry.path}/name", "rb") as f:
+                        rank: int = _CPU_SENSOR_RANKS.get(f.read().strip(), best_rank)
+                except OSError:
+                    continue
+
+                if rank < best_rank:
+                    best_rank, best_path = rank, f"{entry.path}/temp1_input"
+                    if rank == 0:
+                        break
+    except OSError:
+        return None
+
+    return best_path
+
+
 def get_cpu_temperature() -> float | None:
     """
     Retrieves the current CPU temperature from available sensors.
 
-    This function attempts to get the CPU temperature using several known sensor names.
-    It is designed to work on Linux or FreeBSD-based operating systems where the
-    `psutil.sensors_temperatures()` function can read sensor data.
+    On Linux this function reads the single sysfs file found by
+    `get_cpu_temperature_path`, instead of letting `psutil.sensors_temperatures()`
+    read the label, input and limits of every sensor on the machine.
 
-    The function iterates through a list of common sensor names, checking each one until
-    it finds a sensor with a temperature reading. If a sensor is found, it returns the
-    current temperature as a float. If no sensor is found or if an error occurs, it
-    returns None.
+    On systems without `/sys/class/hwmon`, such as FreeBSD, it falls back to
+    `psutil.sensors_temperatures()` and checks the sensor names in `CPU_SENSORS` until
+    it finds one with a temperature reading. If no sensor is found or if an error
+    occurs, it returns None.
 
     Returns:
         float | None: The current CPU temperature if a sensor reading is found,
                             or None if no sensor reading is available.
     """
-    sensors: list[str] = [
-        "coretemp",
-        "k10temp",
-        "cpu-thermal",
-        "lm_sensors",
-        "asus-nb",
-        "lm75",
-        "acpitz",
-    ]
+    temperature_path: str | None = get_cpu_temperature_path()
+    if temperature_path is not None:
+        try:
+            with open(temperature_path) as f:
+                return int(f.read()) / 1000
+        except (OSError, ValueError):
+            return None
+
+    # psutil would only scan the same hwmon devices again. It reads the thermal
+    # zones instead only when there are none, so fall back in that case.
+    try:
+        with os.scandir("/sys/class/hwmon") as entries:
+            if next(entries, None) is not None:
+                return None
+    except OSError:
+        pass
 
-    all_temperatures: dict[str, psutil.shwtemp] = psutil.sensors_temperatures()
-    if all_temperatures is None:
+    import psutil
+
+    if not hasattr(psutil, "sensors_temperatures"):
+        return None
+
+    all_temperatures: dict[str, list[psutil._common.shwtemp]] = (
+        psutil.sensors_temperatures()
+    )
+    if not all_temperatures:
         return None
 
-    for sensor in sensors:
+    for sensor in CPU_SENSORS:
         temperatures = all_temperatures.get(sensor)
         if temperatures:
             return temperatures[0].current
@@ -111,6 +595,176 @@ def get_cpu_temperature() -> float | None:
     return None
 
 
+@functools.lru_cache(maxsize=1)
+def get_battery_path() -> str | None:
+    """
+    Locates the sysfs directory of the first battery on Linux.
+
+    This function scans `/sys/class/power_supply` for an entry that looks like a
+    battery (e.g. "BAT0"), using the same naming rules as `psutil`. Batteries are not
+    added or removed while the program runs, so the result is cached.
+
+    Returns:
+        str | None: The path of the battery directory, or None if no battery is found
+                    or `/sys/class/power_supply` is unavailable.
+    """
+    try:
+        supplies: list[str] = sorted(os.listdir("/sys/class/power_supply"))
+    except OSError:
+        return None
+
+    for supply in supplies:
+        if supply.startswith("BAT") or "battery" in supply.lower():
+            return f"/sys/class/power_supply/{supply}"
+
+    return None
+
+
+def get_battery() -> tuple[float, bool] | None:
+    """
+    Retrieves the battery charge percentage and whether the charger is plugged in.
+
+    On Linux the `capacity` and `status` files of the battery found by
+    `get_battery_path` are read directly, which avoids the generic directory scan
+    `psutil.sensors_battery()` performs on every call. On other platforms, it falls
+    back to `psutil.sensors_battery()`.
+
+    Returns:
+        tuple[float, bool] | None: The charge percentage and the plugged-in state,
+                                   or None if the machine has no battery.
+    """
+    battery_path: str | None = get_battery_path()
+    if battery_path is not None:
+        try:
+            with open(f"{battery_path}/capacity") as f:
+                percent: float = float(f.read())
+            with open(f"{battery_path}/status") as f:
+                status: str = f.read().strip().lower()
+            return percent, status != "discharging"
+        except (OSError, ValueError):
+            pass
+
+    # On Linux psutil would only scan the same sysfs directory again
+    if sys.platform.startswith("linux"):
+        return None
+
+    import psutil
+
+    if not hasattr(psutil, "sensors_battery"):
+        return None
+
+    battery: psutil._common.sbattery | None = psutil.sensors_battery()
+    if battery is None:
+        return None
+
+    return battery.percent, bool(battery.power_plugged)
+
+
+def get_uptime() -> float:
+    """
+    Retrieves the time elapsed since the machine booted.
+
+    On Linux the `CLOCK_BOOTTIME` clock is read, which is the uptime itself and
+    costs a single `clock_gettime` call. If that clock is unavailable, the first field
+    of `/proc/uptime` is read instead. On other platforms, it falls back to
+    subtracting `psutil.boot_time()` from the current time.
+
+    Returns:
+        float: The uptime in seconds.
+    """
+    if hasattr(time, "CLOCK_BOOTTIME"):
+        try:
+            return time.clock_gettime(time.CLOCK_BOOTTIME)
+        except OSError:
+            pass
+
+    uptime: bytes | None = read_proc_file("/proc/uptime", 64)
+    try:
+        if uptime:
+            return float(uptime.split()[0])
+    except (ValueError, IndexError):
+        pass
+
+    import psutil
+
+    return time.time() - psutil.boot_time()
+
+
+def get_memory_usage() -> tuple[int, int, float]:
+    """
+    Retrieves the RAM usage of the machine.
+
+    On Linux `/proc/meminfo` is read in one go and only its `MemTotal` and
+    `MemAvailable` lines are parsed, stopping as soon as both are found, instead of
+    letting `psutil.virtual_memory()` parse the whole file. Used memory is the memory
+    that is not available for new allocations (total - available), which is larger
+    than psutil's own `used` figure since it also counts unreclaimable caches and
+    buffers. On other platforms, it falls back to `psutil.virtual_memory()`, using
+    the same total - available definition.
+
+    Returns:
+        tuple[int, int, float]: The used bytes, total bytes and usage percentage.
+    """
+    meminfo: dict[bytes, int] = {}
+    meminfo_file: bytes = read_proc_file("/proc/meminfo") or b""
+    try:
+        for line in meminfo_file.split(b"\n"):
+            if line.startswith((b"MemTotal:", b"MemAvailable:")):
+                key, value = line.split(b":", 1)
+                meminfo[key] = int(value.split()[0]) * 1024
+                if len(meminfo) == 2:
+                    break
+    except ValueError:
+        pass
+
+    if len(meminfo) < 2 or not meminfo[b"MemTotal"]:
+        import psutil
+
+        ram_usage: psutil._pslinux.svmem = psutil.virtual_memory()
+        ram_used: int = ram_usage.total - ram_usage.available
+        return ram_used, ram_usage.total, ram_usage.percent
+
+    total: int = meminfo[b"MemTotal"]
+    used: int = total - meminfo[b"MemAvailable"]
+    return used, total, round(used / total * 100, 1)
+
+
+def get_disk_usage(path: str) -> tuple[int, int, float]:
+    """
+    Retrieves the disk usage of the filesystem containing the given path.
+
+    This function calls `os.statvfs` directly and computes the same figures as
+    `psutil.disk_usage`: the used space excludes blocks reserved for root, and the
+    percentage is relative to the space available to unprivileged users. On
+    platforms without `os.statvfs` (e.g. Windows), it falls back to `psutil`.
+
+    Args:
+        path (str): A path on the filesystem to inspect.
+
+    Returns:
+        tuple[int, int, float]: The used bytes, total bytes and usage percentage.
+    """
+    if not hasattr(os, "statvfs"):
+        import psutil
+
+        disk_usage: psutil._common.sdiskusage = psutil.disk_usage(path)
+        return disk_usage.used, disk_usage.total, disk_usage.percent
+
+    st: os.statvfs_result = os.statvfs(path)
+    total: int = st.f_blocks * st.f_frsize
+    used: int = total - st.f_bfree * st.f_frsize
+    total_user: int = used + st.f_bavail * st.f_frsize
+    percent: float = round(used / total_user * 100, 1) if total_user else 0.0
+    return used, total, percent
+
+
+# Color buckets: values below the first threshold are green, below the second
+# yellow, and red otherwise.
+_LEVEL_COLORS: tuple[str, str, str] = ("green", "yellow", "red")
+_TEMP_THRESHOLDS: tuple[float, float] = (60, 70)
+_USAGE_THRESHOLDS: tuple[float, float] = (60, 80)
+
+
 def color_cpu_temp(temp: float) -> str:
     """
     Determines the color label for the CPU temperature based on its value.
@@ -126,12 +780,7 @@ def color_cpu_temp(temp: float) -> str:
     Returns:
         str: The color label ("green", "yellow", or "red") representing the temperature level.
     """
-    if temp < 60:
-        return "green"
-    elif temp < 70:
-        return "yellow"
-    else:
-        return "red"
+    return _LEVEL_COLORS[bisect.bisect_right(_TEMP_THRESHOLDS, temp)]
 
 
 def color_usage_percent(percent: float) -> str:
@@ -149,166 +798,199 @@ def color_usage_percent(percent: float) -> str:
     Returns:
         str: The color label ("green", "yellow", or "red") representing the usage level.
     """
-    if percent < 60:
-        return "green"
-    elif percent < 80:
-        return "yellow"
-    else:
-        return "red"
-
-
-def get_os_logo(os_name: str) -> str:
+    return _LEVEL_COLORS[bisect.bisect_right(_USAGE_THRESHOLDS, percent)]
+
+
+# Logo icon and color for each operating system, keyed by the `ID` field of
+# /etc/os-release ("macos" and "windows" are used for those platforms). Ubuntu
+# flavours such as Kubuntu report ID=ubuntu and share its logo. Only the logo that
+# is actually displayed gets colored.
+_LOGO_BY_ID: dict[str, tuple[str, str]] = {
+    "alpine": ("", "blue"),
+    "arch": ("󰣇", "blue"),
+    "artix": ("", "blue"),
+    "centos": ("", "yellow"),
+    "debian": ("", "red"),
+    "deepin": ("", "blue"),
+    "elementary": ("", "blue"),
+    "endeavouros": ("", "magenta"),
+    "fedora": ("", "blue"),
+    "freebsd": ("", "red"),
+    "garuda": ("", "yellow"),
+    "gentoo": ("󰣨", "white"),
+    "hyperbola": ("", "blue"),
+    "kali": ("", "blue"),
+    "linuxmint": ("󰣭", "green"),
+    "macos": ("", "white"),
+    "mageia": ("", "blue"),
+    "manjaro": ("", "green"),
+    "mx": ("", "white"),
+    "neon": ("", "blue"),
+    "nixos": ("", "blue"),
+    "opensuse-leap": ("", "green"),
+    "opensuse-tumbleweed": ("", "green"),
+    "parabola": ("", "blue"),
+    "parrot": ("", "green"),
+    "pop": ("", "blue"),
+    "postmarketos": ("", "green"),
+    "puppy": ("", "white"),
+    "qubes": ("", "blue"),
+    "raspbian": ("", "red"),
+    "rhel": ("Red Hat Enterprise Linux", "red"),
+    "slackware": ("", "blue"),
+    "solus": ("", "blue"),
+    "tails": ("", "magenta"),
+    "ubuntu": ("", "yellow"),
+    "vanilla": ("", "yellow"),
+    "void": ("", "green"),
+    "windows": ("", "blue"),
+    "zorin": ("", "blue"),
+}
+_DEFAULT_LOGO: tuple[str, str] = ("", "yellow")
+
+
+def get_os_logo(os_id: str, id_like: str = "") -> str:
     """
-    Returns the corresponding logo icon for a given operating system name.
+    Returns the corresponding logo icon for a given operating system ID.
 
-    This function uses a dictionary to map operating system names to their respective
-    logo icons, with the icon colored using the `colored` function.
+    This function looks the ID up in `_LOGO_BY_ID`, which maps `/etc/os-release`
+    IDs to their respective logo icons and colors, and colors only the matching
+    icon. Derivatives without a logo of their own fall back to the first
+    distribution in `id_like` that has one.
 
-    If the specified operating system name is not found in the dictionary, a default icon
-    is returned.
+    If neither the ID nor any of the `id_like` entries is found in the dictionary,
+    a default icon is returned.
 
     Args:
-        os_name (str): The name of the operating system.
+        os_id (str): The `ID` of the operating system, e.g. "ubuntu".
+        id_like (str): The space-separated `ID_LIKE` of the operating system.
 
     Returns:
         str: The logo icon for the specified operating system, with color formatting applied.
     """
-    logo_dict: dict[str, str] = {
-        "Alpine Linux": colored("", "blue"),
-        "Arch Linux": colored("󰣇", "blue"),
-        "Artix Linux": colored("", "blue"),
-        "CentOS Stream 9": colored("", "yellow"),
-        "Debian GNU/Linux 11 Bullseye": colored("", "red"),
-        "Deepin": colored("", "blue"),
-        "Elementary OS 7: Loki": colored("", "blue"),
-        "EndeavourOS": colored("", "magenta"),
-        "Fedora Linux": colored("", "blue"),
-        "FreeBSD": colored("", "red"),
-        "Parabola GNU/Linux-libre": colored("", "blue"),
-        "Garuda Linux": colored("", "yellow"),
-        "Gentoo Linux": colored("󰣨", "white"),
-        "Hyperbola GNU/Linux-libre": colored("", "blue"),
-        "Kali Linux": colored("", "blue"),
-        "KDE Neon": colored("", "blue"),
-        "Kubuntu": colored("", "blue"),
-        "Linux Mint 21 Cinnamon": colored("󰣭", "green"),
-        "Lubuntu": colored("", "blue"),
-        "macOS": colored("", "white"),
-        "Mageia": colored("", "blue"),
-        "Manjaro Linux": colored("", "green"),
-        "MX Linux": colored("", "white"),
-        "NixOS": colored("", "blue"),
-        "openSUSE Leap 15.4": colored("", "green"),
-        "openSUSE Tumbleweed": colored("", "green"),
-        "Parrot Security OS": colored("", "green"),
-        "Pop!_OS 22.04": colored("", "blue"),
-        "PostmarketOS": colored("", "green"),
-        "Puppy Linux": colored("", "white"),
-        "Qubes OS": colored("", "blue"),
-        "Raspberry Pi OS": colored("", "red"),
-        "Red Hat Enterprise Linux": colored("Red Hat Enterprise Linux", "red"),
-        "Slackware Linux": colored("", "blue"),
-        "Solus": colored("", "blue"),
-        "Tails": colored("", "magenta"),
-        "Ubuntu 22.04 LTS": colored("", "yellow"),
-        "Ubuntu Budgie": colored("", "magenta"),
-        "Vanilla OS": colored("", "yellow"),
-        "Void Linux": colored("", "green"),
-        "Windows": colored("", "blue"),
-        "Xubuntu": colored("", "blue"),
-        "Zorin OS": colored("", "blue"),
-    }
-
-    return logo_dict.get(os_name, colored("", "yellow"))
-
-
-def color_line() -> str:
-    """
-    Creates a colored line of symbols using predefined colors.
-
-    This function constructs a string consisting of colored symbols,
-    where each symbol is colored using the `colored` function. The
-    symbols used are the same for each color.
+    logo: tuple[str, str] | None = _LOGO_BY_ID.get(os_id)
+    if logo is None:
+        for like in id_like.split():
+            logo = _LOGO_BY_ID.get(like)
+            if logo is not None:
+                break
+        else:
+            logo = _DEFAULT_LOGO
+
+    icon, color = logo
+    return colored(icon, color)
+
+
+@functools.lru_cache(maxsize=1)
+def get_os_info() -> tuple[str, str]:
+    """
+    Retrieves the name of the operating system and its logo icon.
+
+    On macOS and Windows the name is built from the platform version. On other
+    systems it is the `PRETTY_NAME` from `/etc/os-release`, while the logo is
+    chosen by the machine-readable `ID` and `ID_LIKE` fields, which stay the same
+    across releases. The result is cached, since it does not change while the
+    program runs.
 
     Returns:
-        str: A string containing colored symbols in a single line.
+        tuple[str, str]: The operating system name and its colored logo icon.
     """
-    colors: list[str] = ["red", "yellow", "green", "blue", "cyan", "magenta"]
-    colored_line: str = " ".join(colored(" ", color) for color in colors)
-    return colored_line
+    os_type: str = platform.system()
+    version: str
+
+    if os_type == "Darwin":
+        version = platform.mac_ver()[0]
+        return f"macOS {version}", get_os_logo("macos")
+    elif os_type == "Windows":
+        version = platform.win32_ver()[0]
+        return f"Windows {version}", get_os_logo("windows")
+
+    os_release: dict[str, str] = platform.freedesktop_os_release()
+    os_name: str = os_release.get("PRETTY_NAME", "Linux")
+    os_id: str = os_release.get("ID", "linux")
+    return os_name, get_os_logo(os_id, os_release.get("ID_LIKE", ""))
+
+
+# Color ribbons shown at the bottom of the output. They never change, so they are
+# built once at import. COLOR_LINE is a plainer alternative to DYNAMIC_COLOR_LINE.
+_COLORS: tuple[str, ...] = ("red", "yellow", "green", "blue", "cyan", "magenta")
+_SYMBOLS: tuple[str, ...] = ("󱚝", "󱚟", "󱚣", "󰚩", "󱜙", "󱚥")
+COLOR_LINE: str = " ".join(colored(" ", color) for color in _COLORS)
+DYNAMIC_COLOR_LINE: str = " ".join(
+    colored(symbol, color) for symbol, color in zip(_SYMBOLS, _COLORS)
+)
 
 
-def dynamic_color_line() -> str:
+def get_ip_addresses(
+    show_public_ip: bool, show_private_ip: bool
+) -> tuple[str | None, str | None]:
     """
-    Creates a dynamically colored line of symbols.
+    Retrieves the requested IP addresses.
 
-    This function constructs a string consisting of colored symbols,
-    where each symbol is associated with a corresponding color from
-    two predefined lists. Each symbol is colored using the `colored`
-    function.
+    The public IP lookup may wait on the network, so when both addresses are
+    requested the two lookups run concurrently in a small thread pool. The pool is
+    only imported and started in that case, since `concurrent.futures` is costly to
+    import and the default invocation shows no IP addresses.
+
+    Args:
+        show_public_ip (bool): Whether to retrieve the public IP address.
+        show_private_ip (bool): Whether to retrieve the private IP address.
 
     Returns:
-        str: A string containing dynamically colored symbols in a single line.
+        tuple[str | None, str | None]: The private and public IP addresses, each None
+                                       if not requested or not available.
     """
-    colors: list[str] = ["red", "yellow", "green", "blue", "cyan", "magenta"]
-    symbols: list[str] = ["󱚝", "󱚟", "󱚣", "󰚩", "󱜙", "󱚥"]
+    if not (show_public_ip and show_private_ip):
+        private_ip: str | None = get_private_ip() if show_private_ip else None
+        public_ip: str | None = get_public_ip() if show_public_ip else None
+        return private_ip, public_ip
 
-    colored_line: str = " ".join(
-        colored(symbols[i], colors[i]) for i in range(len(colors))
-    )
-    return colored_line
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        public_ip_future: Future[str | None] = executor.submit(get_public_ip)
+        private_ip_future: Future[str | None] = executor.submit(get_private_ip)
+        return private_ip_future.result(), public_ip_future.result()
 
 
-def get_system_info() -> dict[str, typing.Any]:
+# Multiplier converting a byte count to GiB
+_INV_GB: float = 1.0 / (1 << 30)
+
+
+def get_system_info(
+    show_public_ip: bool = False,
+    show_private_ip: bool = False,
+    sample_cpu: bool = False,
+) -> list[tuple[str, typing.Any]]:
     """
     Retrieves system information including OS details, username, uptime,
     CPU information, memory usage, disk space, and IP addresses.
 
     This function uses various system libraries to gather information about
-    the system and returns it in a structured dictionary format.
+    the system and returns it as an ordered list of (icon, value) rows. The local
+    probes are plain `/proc` and `/sys` reads and run one after another. The IP
+    address probes are only run when requested, so the default invocation never
+    loads the HTTP/TLS machinery needed for the public IP.
+
+    Args:
+        show_public_ip (bool): Whether to include the public IP address.
+        show_private_ip (bool): Whether to include the private IP address.
+        sample_cpu (bool): Whether to include the CPU usage, which waits for a
+                           sample window (see `get_cpu_usage`).
 
     Returns:
-        dict[str, typing.Any]: A dictionary containing system information.
+        list[tuple[str, typing.Any]]: The system information rows, in display order.
     """
-    parser: argparse.ArgumentParser = argparse.ArgumentParser(
-        description="RichFetch - A customizable system information tool"
-    )
-    parser.add_argument(
-        "--show-public-ip", action="store_true", help="Show public IP address"
-    )
-    parser.add_argument(
-        "--show-private-ip", action="store_true", help="Show private IP address"
-    )
-    args: argparse.Namespace = parser.parse_args()
-
     # OS name and version
-    os_type: str = platform.system()
-    os_name: str
-    os_logo: str
-
-    if os_type == "Darwin":
-        version = platform.mac_ver()[0]
-        os_name = f"macOS {version}"
-        os_logo = get_os_logo("macOS")
-    elif os_type == "Windows":
-        version = platform.win32_ver()
-        os_name = f"Windows {version}"
-        os_logo = get_os_logo("Windows")
-    else:
-        os_name = platform.freedesktop_os_release()["PRETTY_NAME"]
-        os_logo = get_os_logo(os_name)
+    os_name, os_logo = get_os_info()
 
     # Username and hostname
-    username: str = os.getlogin()
-    hostname: str = os.uname().nodename
+    username: str = _USERNAME
+    hostname: str = _HOSTNAME
 
     # Uptime calculation
-    uptime_seconds: float = psutil.boot_time()
-    current_time: datetime = datetime.now()
-    boot_time: timedelta = current_time - datetime.fromtimestamp(uptime_seconds)
-    uptime_str: str = (
-        f"{int(boot_time.total_seconds() // 3600)} hrs, {int((boot_time.total_seconds() % 3600) // 60)} mins"
-    )
+    uptime_hours, uptime_rest = divmod(int(get_uptime()), 3600)
+    uptime_str: str = f"{uptime_hours} hrs, {uptime_rest // 60} mins"
 
     # Window Manager (WM)
     wm: str | None = os.environ.get("DESKTOP_SESSION") or os.environ.get(
@@ -316,79 +998,173 @@ def get_system_info() -> dict[str, typing.Any]:
     )
 
     # CPU information
-    cpu_info: dict[str, str] = get_cpu_info()
-    cpu_name: str = cpu_info["brand_raw"]
-    cpu_per: float = psutil.cpu_percent()
-    cpu_usage_color: str = color_usage_percent(cpu_per)
+    cpu_name: str = get_cpu_brand()
 
     # Fetching CPU temperature
-    temp: float = get_cpu_temperature()
+    temp: float | None = get_cpu_temperature()
     temp_str: str | None = f"{temp}󰔄" if temp is not None else None
-    temp_color: str | None = color_cpu_temp(temp) if temp is not None else "red"
+    temp_color: str = color_cpu_temp(temp) if temp is not None else "red"
 
     # Battery status
-    battery: psutil._common.sbattery = psutil.sensors_battery()
-    battery_percent: str | None = f"{round(battery.percent)}%" if battery else None
-    plugged: bool | None = battery.power_plugged if battery else None
+    battery: tuple[float, bool] | None = get_battery()
+    battery_percent: str | None = f"{round(battery[0])}%" if battery else None
+    plugged: bool | None = battery[1] if battery else None
     battery_logo: str = "󰂄" if plugged else "󱊣"
 
     # Getting IP addresses
-    private_ip: str | None = get_private_ip() if args.show_private_ip else None
-    public_ip: str | None = get_public_ip() if args.show_public_ip else None
+    private_ip, public_ip = get_ip_addresses(show_public_ip, show_private_ip)
 
     # Disk space
-    disk_usage: psutil._common.sdiskusage = psutil.disk_usage("/")
+    disk_used, disk_total, disk_percent = get_disk_usage("/")
     disk_usage_str: str = (
-        f"{disk_usage.used / (1024**3):.2f} / {disk_usage.total / (1024**3):.2f} GB ({disk_usage.percent:.2f}%)"
+        f"{disk_used * _INV_GB:.2f} / {disk_total * _INV_GB:.2f} GB ({disk_percent:.2f}%)"
     )
-    disk_usage_color: str = color_usage_percent(disk_usage.percent)
+    disk_usage_color: str = color_usage_percent(disk_percent)
 
     # RAM space
-    ram_usage: psutil._pslinux.svmem = psutil.virtual_memory()
+    ram_used, ram_total, ram_percent = get_memory_usage()
     ram_usage_str: str = (
-        f"{ram_usage.used / (1024**3):.2f} / {ram_usage.total / (1024**3):.2f} GB ({ram_usage.percent:.2f}%)"
+        f"{ram_used * _INV_GB:.2f} / {ram_total * _INV_GB:.2f} GB ({ram_percent:.2f}%)"
     )
-    ram_usage_color: str = color_usage_percent(ram_usage.percent)
+    ram_usage_color: str = color_usage_percent(ram_percent)
+
+    # CPU usage
+    cpu_per: float | None = get_cpu_usage() if sample_cpu else None
 
     # Colors
-    colored_line: str = dynamic_color_line()
-
-    # Display dictionary
-    display: dict[str, typing.Any] = {
-        colored("", "green"): colored(f"{username}@{hostname}", "green"),
-        os_logo: os_name,
-        colored("", "blue"): cpu_name,
-        colored("", cpu_usage_color): f"{cpu_per}%",
-        **({colored("", temp_color): temp_str} if temp_str else {}),
-        **(
-            {colored(battery_logo, "green"): battery_percent} if battery_percent else {}
-        ),
-        colored("󰨇", "red"): wm,
-        colored("", "magenta"): uptime_str,
-        colored("", ram_usage_color): ram_usage_str,
-        colored("", disk_usage_color): disk_usage_str,
-        **({colored("󰩩", "green"): private_ip} if private_ip else {}),
-        **({colored("󰑩", "green"): public_ip} if public_ip else {}),
-        " ": colored_line,
-    }
-
-    return display
+    colored_line: str = DYNAMIC_COLOR_LINE
+
+    # Display rows, in output order
+    rows: list[tuple[str, typing.Any]] = [
+        (colored("", "green"), colored(f"{username}@{hostname}", "green")),
+        (os_logo, os_name),
+        (colored("", "blue"), cpu_name),
+    ]
+    if cpu_per is not None:
+        rows.append((colored("", color_usage_percent(cpu_per)), f"{cpu_per}%"))
+    if temp_str:
+        rows.append((colored("", temp_color), temp_str))
+    if battery_percent:
+        rows.append((colored(battery_logo, "green"), battery_percent))
+    rows.append((colored("󰨇", "red"), wm))
+    rows.append((colored("", "magenta"), uptime_str))
+    rows.append((colored("", ram_usage_color), ram_usage_str))
+    rows.append((colored("", disk_usage_color), disk_usage_str))
+    if private_ip:
+        rows.append((colored("󰩩", "green"), private_ip))
+    if public_ip:
+        rows.append((colored("󰑩", "green"), public_ip))
+    rows.append((" ", colored_line))
+
+    return rows
+
+
+def format_system_info(system_info: list[tuple[str, typing.Any]]) -> str:
+    """
+    Formats system information rows for display.
+
+    Args:
+        system_info (list[tuple[str, typing.Any]]): The rows returned by
+                                                    `get_system_info`.
+
+    Returns:
+        str: The complete output, one row per line.
+    """
+    lines: list[str] = ["\n"]
+    for key, value in system_info:
+        lines.append(f"  {key}  {value}\n")
+    lines.append("\n")
+
+    return "".join(lines)
+
+
+def watch(interval: float, show_public_ip: bool, show_private_ip: bool) -> None:
+    """
+    Redraws system information every `interval` seconds until interrupted.
+
+    Everything that cannot change while the program runs (CPU brand, OS name and
+    logo, username and hostname) is looked up once and reused, so each frame only
+    refreshes the dynamic metrics. The public IP is throttled by `get_public_ip`
+    rather than looked up every frame. When stdout is a terminal, the screen is
+    cleared before each frame.
+
+    Args:
+        interval (float): The number of seconds between frames.
+        show_public_ip (bool): Whether to include the public IP address.
+        show_private_ip (bool): Whether to include the private IP address.
+    """
+    clear_screen: str = "\x1b[H\x1b[J" if sys.stdout.isatty() else ""
+
+    try:
+        while True:
+            system_info: list[tuple[str, typing.Any]] = get_system_info(
+                show_public_ip, show_private_ip, sample_cpu=True
+            )
+            sys.stdout.write(clear_screen + format_system_info(system_info))
+            sys.stdout.flush()
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        pass
 
 
 def main() -> None:
     """
     Main function to retrieve and display system information.
 
-    This function calls `get_system_info` to retrieve system information
-    and then prints it in a formatted manner.
+    This function parses the command-line flags, calls `get_system_info` to
+    retrieve system information and then prints it in a formatted manner. The
+    whole output is assembled first and written to stdout in a single call. With
+    `--watch`, the output is redrawn periodically by `watch`.
     """
-    system_info: dict[str, typing.Any] = get_system_info()
-
-    print(
-        "\n"
-        + "\n".join(f"  {key}  {value}" for key, value in system_info.items())
-        + "\n"
+    # Command-line flags are scanned directly to keep argparse out of startup
+    args: list[str] = sys.argv[1:]
+    if "-h" in args or "--help" in args:
+        print(USAGE, end="")
+        return
+
+    # Anything else is a typo, except for the value following --watch
+    unknown: list[str] = [
+        arg
+        for position, arg in enumerate(args)
+        if arg not in _FLAGS
+        and not (
+            position > 0
+            and args[position - 1] == "--watch"
+            and not arg.startswith("--")
+        )
+    ]
+    if unknown:
+        sys.stderr.write(USAGE)
+        sys.stderr.write(
+            f"richfetch: error: unrecognized arguments: {' '.join(unknown)}\n"
+        )
+        sys.exit(2)
+
+    show_public_ip: bool = "--show-public-ip" in args
+    show_private_ip: bool = "--show-private-ip" in args
+
+    if "--watch" in args:
+        interval: float = 2.0
+        position: int = args.index("--watch")
+        if position + 1 < len(args) and not args[position + 1].startswith("--"):
+            value: str = args[position + 1]
+            try:
+                interval = float(value)
+                if not (interval > 0 and math.isfinite(interval)):
+                    raise ValueError(value)
+            except ValueError:
+                sys.stderr.write(
+                    f"richfetch: error: invalid --watch interval: {value!r}\n"
+                )
+                sys.exit(2)
+
+        watch(interval, show_public_ip, show_private_ip)
+        return
+
+    system_info: list[tuple[str, typing.Any]] = get_system_info(
+        show_public_ip, show_private_ip
     )
+    sys.stdout.write(format_system_info(system_info))
 
 
 if __name__ == "__main__":
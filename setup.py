@@ -1,3 +1,4 @@
+import os
 import setuptools
 
 
@@ -11,6 +12,15 @@ for line in open("requirements.txt").readlines():
         continue
     requirements.append(req)
 
+# Set RICHFETCH_USE_MYPYC=1 to compile richfetch.py into a C extension with mypyc
+# (requires mypy, types-psutil and a C compiler). The pure Python module is used
+# otherwise.
+ext_modules = []
+if os.environ.get("RICHFETCH_USE_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["richfetch.py"])
+
 
 setuptools.setup(
     name="richfetch",
@@ -22,6 +32,9 @@ setuptools.setup(
     long_description_content_type="text/markdown",
     url="https://github.com/Rizen54/richfetch/",
     packages=setuptools.find_packages(),
+    py_modules=["richfetch"],
+    ext_modules=ext_modules,
+    entry_points={"console_scripts": ["richfetch=richfetch:main"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",